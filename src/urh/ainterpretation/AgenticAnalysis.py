@@ -11,25 +11,66 @@ This enables fully headless / non-interactive signal analysis without
 requiring manual parameter tuning in the GUI.
 """
 
+import collections
+import functools
+import os
+
 import numpy as np
 
 from urh.ainterpretation import AutoInterpretation
 from urh.awre.FormatFinder import FormatFinder
 from urh.signalprocessing.IQArray import IQArray
+from urh.signalprocessing.Message import Message
+from urh.signalprocessing.MessageType import MessageType
 from urh.signalprocessing.ProtocolAnalyzer import ProtocolAnalyzer
 from urh.signalprocessing.Signal import Signal
 
 
+# Estimated parameters of recently analyzed files, least recently used first.
+# Keyed by (absolute path, mtime, size, sample rate, mmap_io) so edited files are
+# reloaded. Only memory-mapped samples are kept along with them: in-memory samples
+# and demodulations of large captures would stay resident as long as the server.
+_SIGNAL_CACHE = collections.OrderedDict()
+_SIGNAL_CACHE_SIZE = 4
+
+
+# Result when no signal could be detected, e.g. for pure noise
+_EMPTY_RESULT = {
+    "signal_parameters": None,
+    "messages": [],
+    "protocol_fields": [],
+    "num_messages": 0,
+}
+
+
 def _empty_result() -> dict:
-    return {
-        "signal_parameters": None,
-        "messages": [],
-        "protocol_fields": [],
-        "num_messages": 0,
-    }
+    # fresh lists, so callers can't extend the shared ones
+    return dict(_EMPTY_RESULT, messages=[], protocol_fields=[])
+
+
+@functools.lru_cache(maxsize=16)
+def _infer_protocol_fields(bits: tuple) -> tuple:
+    """Run AWRE on messages given by their decoded bit strings.
+
+    The result only depends on the bits, so repeated analyses of the same
+    capture reuse it instead of running the field inference again.
+
+    :return: tuple of (name, start, end, message_type name) per field
+    """
+    message_type = MessageType("Default")
+    messages = [Message(list(map(int, b)), 0, message_type) for b in bits]
+
+    format_finder = FormatFinder(messages)
+    format_finder.run()
+
+    return tuple(
+        (label.name, label.start, label.end, msg_type.name)
+        for msg_type in format_finder.message_types
+        for label in msg_type
+    )
 
 
-def _build_result(estimated, protocol_analyzer) -> dict:
+def _build_result(estimated, messages) -> dict:
     messages_out = [
         {
             "bits": msg.decoded_bits_str,
@@ -37,24 +78,16 @@ def _build_result(estimated, protocol_analyzer) -> dict:
             "ascii": msg.decoded_ascii_str,
             "pause": msg.pause,
         }
-        for msg in protocol_analyzer.messages
+        for msg in messages
     ]
 
     protocol_fields = []
-    if len(protocol_analyzer.messages) >= 2:
-        format_finder = FormatFinder(protocol_analyzer.messages)
-        format_finder.run()
-
-        for msg_type in format_finder.message_types:
-            for label in msg_type:
-                protocol_fields.append(
-                    {
-                        "name": label.name,
-                        "start": label.start,
-                        "end": label.end,
-                        "message_type": msg_type.name,
-                    }
-                )
+    if len(messages) >= 2:
+        bits = tuple(msg["bits"] for msg in messages_out)
+        protocol_fields = [
+            {"name": name, "start": start, "end": end, "message_type": mt_name}
+            for name, start, end, mt_name in _infer_protocol_fields(bits)
+        ]
 
     return {
         "signal_parameters": estimated,
@@ -72,9 +105,87 @@ def _apply_estimated_params(signal, estimated):
     signal.samples_per_symbol = estimated["bit_length"]
 
 
+def _demodulate(signal, estimated) -> list:
+    _apply_estimated_params(signal, estimated)
+
+    protocol_analyzer = ProtocolAnalyzer(signal)
+    protocol_analyzer.get_protocol_from_signal()
+    return protocol_analyzer.messages
+
+
+def _run_pipeline(signal, estimated) -> dict:
+    """Demodulate *signal* with the *estimated* parameters and build the result."""
+    return _build_result(estimated, _demodulate(signal, estimated))
+
+
+def _run_chunked_pipeline(iq_array, sample_rate: float, chunk_samples: int) -> dict:
+    """Demodulate *iq_array* window by window, so only one window is processed at a time.
+
+    The parameters are estimated on the first window and reused for the others,
+    so a first window without any message yields an empty result.
+    As the last message of a window may be cut off at its border, it is dropped
+    and decoded again as part of the next window, which starts shortly before it.
+    The protocol fields are inferred once on all messages at the end.
+    """
+    estimated = AutoInterpretation.estimate(iq_array.subarray(0, chunk_samples))
+    if estimated is None:
+        return _empty_result()
+
+    overlap = min(2 * estimated["bit_length"], chunk_samples // 2)
+    found = []  # (absolute start, absolute pause start, message)
+    offset = 0
+    while True:
+        end = offset + chunk_samples
+        signal = Signal("", "", sample_rate=sample_rate)
+        signal.iq_array = iq_array.subarray(offset, end)
+        window_messages = _demodulate(signal, estimated)
+
+        next_offset = end - overlap
+        if end < len(iq_array) and window_messages:
+            last_start = offset + window_messages[-1].bit_sample_pos[0] - overlap
+            # a message filling the whole window can't be decoded any better
+            if last_start > offset:
+                next_offset = last_start
+                window_messages = window_messages[:-1]
+
+        for msg in window_messages:
+            msg_start = offset + msg.bit_sample_pos[0]
+            pause_start = offset + msg.bit_sample_pos[-1] - msg.pause
+            found.append((msg_start, pause_start, msg))
+
+        if end >= len(iq_array):
+            break
+        offset = next_offset
+
+    # pauses are cut short at window borders, so take them from the absolute positions
+    next_starts = [msg_start for msg_start, _, _ in found[1:]] + [len(iq_array)]
+    for (_, pause_start, msg), next_start in zip(found, next_starts):
+        if msg.pause > 0:
+            msg.pause = max(next_start - pause_start, 0)
+
+    return _build_result(estimated, [msg for _, _, msg in found])
+
+
+def _is_memory_mapped(iq_array) -> bool:
+    # views of a memmap keep its filename, copies (e.g. after a conversion) don't
+    data = iq_array.data
+    return isinstance(data, np.memmap) and data.filename is not None
+
+
+def _load_signal(signal_path: str, sample_rate: float, mmap_io: bool) -> Signal:
+    if mmap_io and not signal_path.endswith(Signal.LOADER_EXTENSIONS):
+        signal = Signal("", "", sample_rate=sample_rate)
+        signal.iq_array = IQArray.from_file(signal_path, mmap=True)
+        return signal
+
+    return Signal(signal_path, "", sample_rate=sample_rate)
+
+
 def analyze_signal(
     signal_path: str,
     sample_rate: float = 1e6,
+    mmap_io: bool = True,
+    chunk_samples: int = None,
 ) -> dict:
     """Run the full agentic analysis pipeline on a signal file.
 
@@ -85,6 +196,22 @@ def analyze_signal(
     sample_rate : float, optional
         Sample rate in Hz.  Only used for timing information; detection
         algorithms are sample-rate agnostic.  Default is 1 MHz.
+    mmap_io : bool, optional
+        Memory-map raw IQ files (copy-on-write) instead of reading them into
+        memory, so estimation and demodulation share the OS page cache.
+        Formats with a dedicated loader (wav, coco, BLUE, …) are always read.
+        Default is *True*.
+    chunk_samples : int, optional
+        Demodulate the signal in overlapping windows of this many samples
+        instead of at once, which bounds the memory needed for long captures.
+        This only holds for memory-mapped files: unsigned raw IQ (complex16u,
+        cu8, …) is converted in memory, and formats with a dedicated loader or
+        ``mmap_io=False`` read the whole file first.
+        Windows should be clearly longer than the longest message.
+        Parameters are estimated on the first window only, so if the capture
+        starts with silence longer than one window, nothing is found and the
+        result is empty.  Must be positive.  Default is *None* (process the
+        whole signal at once).
 
     Returns
     -------
@@ -94,18 +221,47 @@ def analyze_signal(
         ``protocol_fields``   – list of auto-inferred field descriptors.
         ``num_messages``      – total messages found.
     """
-    signal = Signal(signal_path, "", sample_rate=sample_rate)
+    if chunk_samples is not None:
+        if chunk_samples <= 0:
+            raise ValueError(
+                "chunk_samples must be positive, got {}".format(chunk_samples)
+            )
+        signal = _load_signal(signal_path, sample_rate, mmap_io)
+        return _run_chunked_pipeline(signal.iq_array, sample_rate, chunk_samples)
+
+    stat = os.stat(signal_path)
+    key = (
+        os.path.abspath(signal_path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        sample_rate,
+        mmap_io,
+    )
+
+    try:
+        iq_array, estimated = _SIGNAL_CACHE[key]
+        _SIGNAL_CACHE.move_to_end(key)
+        signal = None
+    except KeyError:
+        signal = _load_signal(signal_path, sample_rate, mmap_io)
+        estimated = AutoInterpretation.estimate(signal.iq_array)
+        iq_array = signal.iq_array if _is_memory_mapped(signal.iq_array) else None
+        _SIGNAL_CACHE[key] = (iq_array, estimated)
+        if len(_SIGNAL_CACHE) > _SIGNAL_CACHE_SIZE:
+            _SIGNAL_CACHE.popitem(last=False)
 
-    estimated = AutoInterpretation.estimate(signal.iq_array)
     if estimated is None:
         return _empty_result()
 
-    _apply_estimated_params(signal, estimated)
-
-    protocol_analyzer = ProtocolAnalyzer(signal)
-    protocol_analyzer.get_protocol_from_signal()
+    if signal is None:
+        if iq_array is None:
+            signal = _load_signal(signal_path, sample_rate, mmap_io)
+        else:
+            signal = Signal("", "", sample_rate=sample_rate)
+            signal.iq_array = iq_array
 
-    return _build_result(estimated, protocol_analyzer)
+    # copy, so callers can't alter the cached parameters through the result
+    return _run_pipeline(signal, dict(estimated))
 
 
 def analyze_iq_array(
@@ -130,22 +286,14 @@ def analyze_iq_array(
     dict
         Same structure as :func:`analyze_signal`.
     """
+    # wrap once and share the view between estimation and demodulation
+    iq_array = IQArray.from_any(iq_array)
+
     estimated = AutoInterpretation.estimate(iq_array, noise=noise, modulation=modulation)
     if estimated is None:
         return _empty_result()
 
     signal = Signal("", "")
-    if isinstance(iq_array, IQArray):
-        signal.iq_array = iq_array
-    else:
-        if iq_array.dtype == np.complex64:
-            signal.iq_array = IQArray(iq_array.view(np.float32))
-        else:
-            signal.iq_array = IQArray(iq_array)
-
-    _apply_estimated_params(signal, estimated)
-
-    protocol_analyzer = ProtocolAnalyzer(signal)
-    protocol_analyzer.get_protocol_from_signal()
+    signal.iq_array = iq_array
 
-    return _build_result(estimated, protocol_analyzer)
+    return _run_pipeline(signal, estimated)
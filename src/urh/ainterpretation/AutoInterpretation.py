@@ -371,8 +371,7 @@ def get_bit_length_from_plateau_lengths(merged_plateau_lengths) -> int:
 
 
 def estimate(iq_array: IQArray, noise: float = None, modulation: str = None) -> dict:
-    if isinstance(iq_array, np.ndarray):
-        iq_array = IQArray(iq_array)
+    iq_array = IQArray.from_any(iq_array)
 
     magnitudes = iq_array.magnitudes
     # find noise threshold
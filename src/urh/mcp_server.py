@@ -18,10 +18,16 @@ import base64
 import json
 import os
 import tempfile
+from operator import itemgetter
 
 import numpy as np
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib json module is the fallback
+    orjson = None
+
 from urh.ainterpretation.AgenticAnalysis import analyze_iq_array, analyze_signal
 
 mcp = FastMCP(
@@ -52,17 +58,112 @@ SUPPORTED_FORMATS = {
     ".mat": "MATLAB Level 5 (requires scipy)",
 }
 
+# MCP clients don't need indented JSON, so pretty printing is opt-in for debugging
+_PRETTY_JSON = os.environ.get("URH_MCP_PRETTY", "0") == "1"
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | (
+        orjson.OPT_INDENT_2 if _PRETTY_JSON else 0
+    )
+_JSON_KWARGS = {"indent": 2} if _PRETTY_JSON else {"separators": (",", ":")}
+
+# SUPPORTED_FORMATS never changes at runtime, so serialize it only once
+_SUPPORTED_FORMATS_JSON = json.dumps(SUPPORTED_FORMATS, **_JSON_KWARGS)
+# tuple, so a file name can be matched with a single str.endswith call
+_SUPPORTED_EXTS = tuple(SUPPORTED_FORMATS.keys())
+
+# Sample types accepted by analyze_iq_data
+_DTYPE_MAP = {
+    "float32": np.float32,
+    "complex64": np.complex64,
+    "int16": np.int16,
+    "int8": np.int8,
+}
+
+# Number of base64 characters decoded per step (multiple of 4, ~1 MiB)
+_BASE64_CHUNK_CHARS = 1 << 20
+
+
+def _decode_base64(data: str) -> np.ndarray:
+    """Decode base64 text into a writable uint8 array.
+
+    Well-formed input is decoded chunk by chunk straight into a preallocated
+    buffer, so neither a full-size intermediate bytes object nor a defensive
+    copy is needed.  Anything else (embedded whitespace, missing padding …)
+    falls back to the lenient :func:`base64.b64decode`.
+    """
+    n_chars = len(data)
+    if n_chars % 4 == 0:
+        n_bytes = (n_chars // 4) * 3 - data[-2:].count("=")
+        buf = np.empty(n_bytes, dtype=np.uint8)
+        try:
+            pos = 0
+            for i in range(0, n_chars, _BASE64_CHUNK_CHARS):
+                chunk = base64.b64decode(
+                    data[i : i + _BASE64_CHUNK_CHARS], validate=True
+                )
+                buf[pos : pos + len(chunk)] = np.frombuffer(chunk, dtype=np.uint8)
+                pos += len(chunk)
+            if pos == n_bytes:
+                return buf
+        except ValueError:
+            pass
+
+    return np.frombuffer(base64.b64decode(data), dtype=np.uint8).copy()
+
+
+def _identity(value):
+    return value
+
+
+def _convert_dict(value: dict) -> dict:
+    return {k: _convert_numpy(v) for k, v in value.items()}
+
+
+def _convert_list(value: list) -> list:
+    return [_convert_numpy(v) for v in value]
+
+
+# Exact-type dispatch for everything that appears in analysis results,
+# so the common leaves cost one dict lookup instead of an isinstance ladder
+_CONVERTERS = {
+    dict: _convert_dict,
+    list: _convert_list,
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+}
+_CONVERTERS.update(
+    (t, int)
+    for t in (
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+    )
+)
+_CONVERTERS.update((t, float) for t in (np.float16, np.float32, np.float64))
+
 
 def _convert_numpy(value):
     """Convert numpy scalars to native Python types for JSON serialization."""
+    converter = _CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+    # Fall back for anything not in the table (subclasses, platform specific widths)
     if isinstance(value, np.integer):
         return int(value)
     if isinstance(value, np.floating):
         return float(value)
     if isinstance(value, dict):
-        return {k: _convert_numpy(v) for k, v in value.items()}
+        return _convert_dict(value)
     if isinstance(value, list):
-        return [_convert_numpy(v) for v in value]
+        return _convert_list(value)
     return value
 
 
@@ -71,6 +172,19 @@ def _serialize_result(result: dict) -> dict:
     return _convert_numpy(result)
 
 
+def _dumps(result: dict) -> str:
+    """Encode a tool result as compact JSON (indented if URH_MCP_PRETTY=1).
+
+    With orjson available numpy scalars are encoded natively in a single C pass;
+    otherwise they are converted to Python types first and encoded with json.
+    Both decode to the same values, except that orjson writes float32 scalars
+    in their shortest float32 form (0.1 instead of 0.10000000149011612).
+    """
+    if orjson is not None:
+        return orjson.dumps(result, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(_serialize_result(result), **_JSON_KWARGS)
+
+
 @mcp.tool()
 def analyze_signal_file(
     signal_path: str,
@@ -97,7 +211,7 @@ def analyze_signal_file(
         return json.dumps({"error": f"File not found: {signal_path}"})
 
     result = analyze_signal(signal_path, sample_rate=sample_rate)
-    return json.dumps(_serialize_result(result), indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -125,35 +239,27 @@ def analyze_iq_data(
     Returns:
         JSON string with the same structure as analyze_signal_file.
     """
+    numpy_dtype = _DTYPE_MAP.get(dtype)
+    if numpy_dtype is None:
+        return json.dumps(
+            {"error": f"Unsupported dtype '{dtype}'. Use: {list(_DTYPE_MAP)}"}
+        )
+
     try:
-        raw_bytes = base64.b64decode(iq_base64)
+        raw_bytes = _decode_base64(iq_base64)
     except Exception as e:
         return json.dumps({"error": f"Invalid base64 data: {e}"})
 
-    dtype_map = {
-        "float32": np.float32,
-        "complex64": np.complex64,
-        "int16": np.int16,
-        "int8": np.int8,
-    }
-    if dtype not in dtype_map:
-        return json.dumps(
-            {"error": f"Unsupported dtype '{dtype}'. Use: {list(dtype_map.keys())}"}
-        )
-
     try:
-        iq_array = np.frombuffer(raw_bytes, dtype=dtype_map[dtype]).copy()
+        iq_array = raw_bytes.view(numpy_dtype)
     except Exception as e:
         return json.dumps({"error": f"Failed to parse IQ data: {e}"})
 
     if iq_array.size == 0:
         return json.dumps({"error": "IQ data is empty"})
 
-    if iq_array.dtype == np.complex64:
-        iq_array = iq_array.view(np.float32)
-
     result = analyze_iq_array(iq_array, noise=noise, modulation=modulation)
-    return json.dumps(_serialize_result(result), indent=2)
+    return _dumps(result)
 
 
 @mcp.tool()
@@ -163,7 +269,7 @@ def list_supported_formats() -> str:
     Returns:
         JSON object mapping file extensions to format descriptions.
     """
-    return json.dumps(SUPPORTED_FORMATS, indent=2)
+    return _SUPPORTED_FORMATS_JSON
 
 
 @mcp.tool()
@@ -182,25 +288,28 @@ def list_signal_files(directory: str) -> str:
     if not os.path.isdir(directory):
         return json.dumps({"error": f"Directory not found: {directory}"})
 
-    supported_exts = set(SUPPORTED_FORMATS.keys())
     files = []
-    for entry in sorted(os.listdir(directory)):
-        full_path = os.path.join(directory, entry)
-        if not os.path.isfile(full_path):
-            continue
-        _, ext = os.path.splitext(entry)
-        ext_lower = ext.lower()
-        if ext_lower in supported_exts:
+    with os.scandir(directory) as it:
+        for entry in it:
+            name_lower = entry.name.lower()
+            if not name_lower.endswith(_SUPPORTED_EXTS):
+                continue
+            _, ext = os.path.splitext(name_lower)
+            # a hidden file named e.g. ".wav" ends with an extension but has none
+            if ext not in SUPPORTED_FORMATS or not entry.is_file():
+                continue
             files.append(
                 {
-                    "path": full_path,
-                    "name": entry,
-                    "size_bytes": os.path.getsize(full_path),
-                    "format": SUPPORTED_FORMATS.get(ext_lower, "Unknown"),
+                    "path": entry.path,
+                    "name": entry.name,
+                    "size_bytes": entry.stat().st_size,
+                    "format": SUPPORTED_FORMATS[ext],
                 }
             )
+    # only sort what matched instead of the whole directory listing
+    files.sort(key=itemgetter("name"))
 
-    return json.dumps({"directory": directory, "files": files, "count": len(files)}, indent=2)
+    return _dumps({"directory": directory, "files": files, "count": len(files)})
 
 
 def main():
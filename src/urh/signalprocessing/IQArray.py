@@ -8,6 +8,18 @@ import numpy as np
 from urh.cythonext.util import get_magnitudes
 
 
+def _map_file(filename: str, dtype) -> np.ndarray:
+    """
+    Map *filename* copy-on-write. Like np.fromfile, a partial trailing item
+    (e.g. of a capture cut off mid-write) is ignored.
+    """
+    count = os.path.getsize(filename) // np.dtype(dtype).itemsize
+    if count == 0:
+        # empty files can't be mapped
+        return np.fromfile(filename, dtype=dtype)
+    return np.memmap(filename, dtype=dtype, mode="c", shape=(count,))
+
+
 class IQArray(object):
     def __init__(self, data: np.ndarray, dtype=None, n=None, skip_conversion=False):
         if data is None:
@@ -204,27 +216,43 @@ class IQArray(object):
         )
 
     @staticmethod
-    def from_file(filename: str):
+    def from_file(filename: str, mmap=False):
+        """
+        :param mmap: map the file copy-on-write instead of reading it into memory,
+                     so pages are only loaded when the samples are accessed
+        """
+        read = _map_file if mmap else np.fromfile
+
         if filename.endswith(".complex16u") or filename.endswith(".cu8"):
             # two 8 bit unsigned integers
             return IQArray(
-                IQArray(data=np.fromfile(filename, dtype=np.uint8)).convert_to(np.int8)
+                IQArray(data=read(filename, dtype=np.uint8)).convert_to(np.int8)
             )
         elif filename.endswith(".complex16s") or filename.endswith(".cs8"):
             # two 8 bit signed integers
-            return IQArray(data=np.fromfile(filename, dtype=np.int8))
+            return IQArray(data=read(filename, dtype=np.int8))
         elif filename.endswith(".complex32u") or filename.endswith(".cu16"):
             # two 16 bit unsigned integers
             return IQArray(
-                IQArray(data=np.fromfile(filename, dtype=np.uint16)).convert_to(
-                    np.int16
-                )
+                IQArray(data=read(filename, dtype=np.uint16)).convert_to(np.int16)
             )
         elif filename.endswith(".complex32s") or filename.endswith(".cs16"):
             # two 16 bit signed integers
-            return IQArray(data=np.fromfile(filename, dtype=np.int16))
+            return IQArray(data=read(filename, dtype=np.int16))
         else:
-            return IQArray(data=np.fromfile(filename, dtype=np.float32))
+            return IQArray(data=read(filename, dtype=np.float32))
+
+    @staticmethod
+    def from_any(data):
+        """
+        Return *data* unchanged if it already is an IQArray, otherwise wrap it.
+        Complex arrays are reinterpreted as interleaved I/Q without copying.
+
+        :rtype: IQArray
+        """
+        if isinstance(data, IQArray):
+            return data
+        return IQArray(data)
 
     @staticmethod
     def convert_array_to_iq(arr: np.ndarray) -> np.ndarray:
@@ -13,6 +13,9 @@ from urh.signalprocessing.ProtocoLabel import ProtocolLabel
 from urh.util.Formatter import Formatter
 from urh.util.Logger import logger
 
+# Maps raw bit values to their characters for bits2string
+_BIT_CHARS = bytes.maketrans(bytes(range(10)), b"0123456789")
+
 
 class Message(object):
     """
@@ -208,7 +211,7 @@ class Message(object):
         return int(end)
 
     def bits2string(self, bits: array.array) -> str:
-        return "".join(map(str, bits))
+        return bits.tobytes().translate(_BIT_CHARS).decode("ascii")
 
     def __len__(self):
         return len(self.plain_bits)
@@ -73,14 +73,22 @@ class Rule(object):
         except ValueError:
             logger.warning("{} could not be cast to integer".format(value))
 
-    def applies_for_message(self, message):
-        data = (
+    def message_data(self, message) -> str:
+        """The decoded message in the representation (bit, hex, ascii) of this rule."""
+        return (
             message.decoded_bits_str
             if self.value_type == 0
             else message.decoded_hex_str
             if self.value_type == 1
             else message.decoded_ascii_str
         )
+
+    def applies_for_message(self, message, data: str = None):
+        """
+        :param data: message_data(message), if already known
+        """
+        if data is None:
+            data = self.message_data(message)
         return OPERATIONS[self.operator](data[self.start : self.end], self.target_value)
 
     @property
@@ -118,17 +126,30 @@ class Ruleset(list):
         super().__init__(rules)
 
     def applies_for_message(self, message):
-        napplied_rules = sum(rule.applies_for_message(message) for rule in self)
+        results = self.__rule_results(message)
 
+        # Stop at the first rule that decides the outcome
         if self.mode == Mode.all_apply:
-            return napplied_rules == len(self)
+            return all(results)
         elif self.mode == Mode.atleast_one_applies:
-            return napplied_rules > 0
+            return any(results)
         elif self.mode == Mode.none_applies:
-            return napplied_rules == 0
+            return not any(results)
         else:
             raise ValueError("Unknown behavior " + str(self.mode))
 
+    def __rule_results(self, message):
+        # Rules of the same value type compare against the same decoded string,
+        # so build it only once per message instead of once per rule
+        data_by_value_type = {}
+        for rule in self:
+            value_type = rule.value_type
+            try:
+                data = data_by_value_type[value_type]
+            except KeyError:
+                data = data_by_value_type[value_type] = rule.message_data(message)
+            yield rule.applies_for_message(message, data)
+
     def to_xml(self) -> ET.Element:
         root = ET.Element("ruleset")
         root.set("mode", str(self.mode.value))
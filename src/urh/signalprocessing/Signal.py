@@ -18,6 +18,68 @@ from urh.signalprocessing.IQArray import IQArray
 from urh.util import FileOperator
 from urh.util.Logger import logger
 
+# X-Midas BLUE header fields from offset 32 on, per header byte order:
+# data_start, data_size, (type_code), format and the adjunct xdelta at 264
+_BLUE_HEADER_FIELDS = {endian: struct.Struct(endian + "dd4x2s210xd") for endian in "<>"}
+
+# Byte order of X-Midas BLUE header and data, by the first byte of head_rep / data_rep:
+# "EEEI" is big endian, everything else ("IEEE") is little endian
+_BLUE_BYTE_ORDERS = {ord("E"): ">"}
+
+# Map of BLUE format code → (numpy dtype, is_complex, atoms_per_element)
+_BLUE_FORMATS = {
+    "SF": (np.float32, False, 1),
+    "CF": (np.float32, True, 2),
+    "SD": (np.float64, False, 1),
+    "CD": (np.float64, True, 2),
+    "SI": (np.int16, False, 1),
+    "CI": (np.int16, True, 2),
+    "SB": (np.int8, False, 1),
+    "CB": (np.int8, True, 2),
+    "SL": (np.int32, False, 1),
+    "CL": (np.int32, True, 2),
+}
+
+# Payload dtype with its byte order by (format code, data byte order)
+_BLUE_PAYLOAD_DTYPES = {
+    (fmt_code, endian): np.dtype(dtype).newbyteorder(endian)
+    for fmt_code, (dtype, _, _) in _BLUE_FORMATS.items()
+    for endian in "<>"
+}
+
+
+def _parse_xmidas_header(header: bytes):
+    """Parse and validate the 512-byte header of an X-Midas BLUE file.
+
+    :raises ValueError: if the header is truncated, corrupted or unsupported
+    :return: data byte order, data_start, data_size, format code and xdelta
+    """
+    if len(header) < 512:
+        raise ValueError("File too small to be an X-Midas BLUE file")
+
+    # Header byte order from head_rep (offset 4), data byte order from data_rep (8)
+    hdr_endian = _BLUE_BYTE_ORDERS.get(header[4], "<")
+    data_endian = _BLUE_BYTE_ORDERS.get(header[8], "<")
+
+    # Parse key header fields using header endianness in a single call
+    data_start, data_size, fmt_bytes, xdelta = _BLUE_HEADER_FIELDS[
+        hdr_endian
+    ].unpack_from(header, 32)
+    try:
+        fmt_code = fmt_bytes.decode("ascii").strip("\x00")
+    except UnicodeDecodeError:
+        raise ValueError("Corrupted X-Midas BLUE header: invalid format code bytes")
+
+    if fmt_code not in _BLUE_FORMATS:
+        raise ValueError("Unsupported X-Midas BLUE format code: {!r}".format(fmt_code))
+
+    if data_start < 0 or data_size < 0:
+        raise ValueError(
+            "Invalid X-Midas BLUE header: negative data_start or data_size"
+        )
+
+    return data_endian, data_start, data_size, fmt_code, xdelta
+
 
 class Signal(QObject):
     """
@@ -84,18 +146,12 @@ class Signal(QObject):
         self.__already_demodulated = False
 
         if len(filename) > 0:
-            if self.wav_mode:
-                self.__load_wav_file(filename)
-            elif self.flipper_raw_mode:
-                self.__load_sub_file(filename)
-            elif filename.endswith(".coco"):
-                self.__load_compressed_complex(filename)
-            elif filename.endswith(".blu") or filename.endswith(".blue"):
-                self.__load_xmidas_file(filename)
-            elif filename.endswith(".mat"):
-                self.__load_matlab_file(filename)
+            for extension, load in self.__FILE_LOADERS.items():
+                if filename.endswith(extension):
+                    break
             else:
-                self.__load_complex_file(filename)
+                load = Signal.__load_complex_file
+            load(self, filename)
 
             self.filename = filename
 
@@ -224,84 +280,38 @@ class Signal(QObject):
         data format, byte order, data offset, and sample rate (via *xdelta*).
         """
 
-        # Map of BLUE format code → (numpy dtype, is_complex, atoms_per_element)
-        _BLUE_FORMATS = {
-            "SF": (np.float32, False, 1),
-            "CF": (np.float32, True, 2),
-            "SD": (np.float64, False, 1),
-            "CD": (np.float64, True, 2),
-            "SI": (np.int16, False, 1),
-            "CI": (np.int16, True, 2),
-            "SB": (np.int8, False, 1),
-            "CB": (np.int8, True, 2),
-            "SL": (np.int32, False, 1),
-            "CL": (np.int32, True, 2),
-        }
-
         with open(filename, "rb") as f:
             header = f.read(512)
 
-        if len(header) < 512:
-            raise ValueError("File too small to be an X-Midas BLUE file")
-
-        # Determine header byte order from head_rep at offset 4
-        head_rep = header[4:8]
-        if head_rep[:1] == b"E":
-            hdr_endian = ">"
-        else:
-            hdr_endian = "<"
-
-        # Determine data byte order from data_rep at offset 8
-        data_rep = header[8:12]
-        if data_rep[:1] == b"E":
-            data_endian = ">"
-        else:
-            data_endian = "<"
-
-        # Parse key header fields using header endianness
-        data_start = struct.unpack(hdr_endian + "d", header[32:40])[0]
-        data_size = struct.unpack(hdr_endian + "d", header[40:48])[0]
-        try:
-            fmt_code = header[52:54].decode("ascii").strip("\x00")
-        except UnicodeDecodeError:
-            raise ValueError(
-                "Corrupted X-Midas BLUE header: invalid format code bytes"
-            )
-
-        # Adjunct area (type 1000 vector): xstart at 256, xdelta at 264
-        xdelta = struct.unpack(hdr_endian + "d", header[264:272])[0]
-
-        if fmt_code not in _BLUE_FORMATS:
-            raise ValueError(
-                "Unsupported X-Midas BLUE format code: {!r}".format(fmt_code)
-            )
+        data_endian, data_start, data_size, fmt_code, xdelta = _parse_xmidas_header(
+            header
+        )
 
-        dtype, is_complex, atoms = _BLUE_FORMATS[fmt_code]
-
-        if data_start < 0 or data_size < 0:
-            raise ValueError(
-                "Invalid X-Midas BLUE header: negative data_start or data_size"
-            )
+        _, is_complex, atoms = _BLUE_FORMATS[fmt_code]
+        raw_dtype = _BLUE_PAYLOAD_DTYPES[fmt_code, data_endian]
 
         data_start_int = int(data_start)
         data_size_int = int(data_size)
-        bytes_per_atom = np.dtype(dtype).itemsize
+        bytes_per_atom = raw_dtype.itemsize
 
         num_atoms = data_size_int // bytes_per_atom
 
-        with open(filename, "rb") as f:
-            f.seek(data_start_int)
-            raw = np.frombuffer(
-                f.read(data_size_int), dtype=dtype, count=num_atoms
-            ).copy()
-
-        # Swap bytes if data endianness differs from native
-        native = "<" if np.little_endian else ">"
-        if data_endian != native:
-            raw = raw.byteswap()
+        # Map the payload instead of reading it, so the conversion below
+        # is the only copy that is made of it
+        if num_atoms > 0:
+            raw = np.memmap(
+                filename,
+                dtype=raw_dtype,
+                mode="r",
+                offset=data_start_int,
+                shape=(num_atoms,),
+            )
+        else:
+            raw = np.empty(0, dtype=raw_dtype)
 
-        if raw.dtype != np.float32:
-            raw = raw.astype(np.float32)
+        # A single pass swaps bytes (if needed) and converts to a native float32
+        # array, which is writable and no longer backed by the file
+        raw = np.array(raw, dtype=np.float32)
 
         if is_complex:
             self.iq_array = IQArray(raw)
@@ -360,6 +370,17 @@ class Signal(QObject):
             self.iq_array.real = real
             self.__already_demodulated = True
 
+    # Formats with a dedicated loader, anything else is read as raw IQ samples
+    __FILE_LOADERS = {
+        ".wav": __load_wav_file,
+        ".sub": __load_sub_file,
+        ".coco": __load_compressed_complex,
+        ".blu": __load_xmidas_file,
+        ".blue": __load_xmidas_file,
+        ".mat": __load_matlab_file,
+    }
+    LOADER_EXTENSIONS = tuple(__FILE_LOADERS)
+
     @property
     def already_demodulated(self) -> bool:
         return self.__already_demodulated
@@ -185,8 +185,7 @@ def ask_signal_file_name_and_save(
 
 
 def save_data(data, filename: str, sample_rate=1e6, num_channels=2):
-    if not isinstance(data, IQArray):
-        data = IQArray(data)
+    data = IQArray.from_any(data)
 
     if filename.endswith(".wav"):
         data.export_to_wav(filename, num_channels, sample_rate)
@@ -3,6 +3,8 @@ import copy
 from enum import Enum
 from xml.etree import ElementTree as ET
 
+import numpy as np
+
 from urh.util import util
 from urh.util.GenericCRC import GenericCRC
 
@@ -20,6 +22,11 @@ class WSPChecksum(object):
         crc8 = 3
 
     CRC_8_POLYNOMIAL = array.array("B", [1, 0, 0, 0, 0, 0, 1, 1, 1])  # x^8+x^2+x+1
+    # RORG nibbles of switch telegrams, which use checksum4 in auto mode
+    SWITCH_TELEGRAM_RORGS = (util.hex2bit("5"), util.hex2bit("6"))
+
+    # shared, so the CRC is not set up again for every message
+    CRC_8 = GenericCRC(polynomial=CRC_8_POLYNOMIAL)
 
     def __init__(self, mode=ChecksumMode.auto):
         self.mode = mode
@@ -45,7 +52,7 @@ class WSPChecksum(object):
         """
         try:
             if self.mode == self.ChecksumMode.auto:
-                if msg[0:4] == util.hex2bit("5") or msg[0:4] == util.hex2bit("6"):
+                if msg[0:4] in self.SWITCH_TELEGRAM_RORGS:
                     # Switch telegram
                     return self.checksum4(msg)
 
@@ -93,24 +100,28 @@ class WSPChecksum(object):
 
     @classmethod
     def checksum4(cls, bits: array.array) -> array.array:
-        hash = 0
         val = copy.copy(bits)
         val[-4:] = array.array("B", [False, False, False, False])
-        for i in range(0, len(val), 8):
-            hash += int("".join(map(str, map(int, val[i : i + 8]))), 2)
+        val = np.array(val, dtype=np.uint8)
+
+        # sum of all bytes, a trailing partial byte counts with its plain value
+        n = len(val) - len(val) % 8
+        hash = int(np.packbits(val[:n]).sum())
+        if n < len(val):
+            hash += int(np.packbits(val[n:])[0]) >> (8 - (len(val) - n))
         hash = (((hash & 0xF0) >> 4) + (hash & 0x0F)) & 0x0F
         return array.array("B", list(map(bool, map(int, "{0:04b}".format(hash)))))
 
     @classmethod
     def checksum8(cls, bits: array.array) -> array.array:
-        hash = 0
-        for i in range(0, len(bits) - 8, 8):
-            hash += int("".join(map(str, map(int, bits[i : i + 8]))), 2)
+        # sum of all full bytes starting before the trailing checksum byte
+        n = 8 * len(range(0, len(bits) - 8, 8))
+        hash = int(np.packbits(np.array(bits[:n], dtype=np.uint8)).sum())
         return array.array("B", list(map(bool, map(int, "{0:08b}".format(hash % 256)))))
 
     @classmethod
     def crc8(cls, bits: array.array):
-        return array.array("B", GenericCRC(polynomial=cls.CRC_8_POLYNOMIAL).crc(bits))
+        return array.array("B", cls.CRC_8.crc(bits))
 
     def to_xml(self) -> ET.Element:
         root = ET.Element("wsp_checksum")
@@ -3,6 +3,7 @@ import unittest
 import numpy as np
 
 from tests.utils_testing import get_path_for_data_file
+from urh.ainterpretation import AgenticAnalysis
 from urh.ainterpretation.AgenticAnalysis import analyze_signal, analyze_iq_array
 from urh.signalprocessing.Signal import Signal
 
@@ -50,6 +51,49 @@ class TestAgenticAnalysis(unittest.TestCase):
         for msg in result["messages"]:
             self.assertTrue(msg["hex"].startswith("aaaaaaaa"))
 
+    def test_analyze_signal_mmap_matches_full_read(self):
+        """Memory-mapped loading must not change the analysis result."""
+        path = get_path_for_data_file("homematic.complex32s")
+        mapped = analyze_signal(path, mmap_io=True)
+        loaded = analyze_signal(path, mmap_io=False)
+
+        # both calls were analyzed on their own and not served from the cache
+        cached_iq_arrays = {
+            key[-1]: iq_array
+            for key, (iq_array, _) in AgenticAnalysis._SIGNAL_CACHE.items()
+            if key[0].endswith("homematic.complex32s")
+        }
+        self.assertEqual(set(cached_iq_arrays), {True, False})
+        # only memory-mapped samples are kept in the cache
+        self.assertIsNotNone(cached_iq_arrays[True])
+        self.assertIsNone(cached_iq_arrays[False])
+
+        self.assertEqual(mapped["signal_parameters"], loaded["signal_parameters"])
+        self.assertEqual(mapped["messages"], loaded["messages"])
+
+    def test_analyze_signal_chunked(self):
+        """Windowed demodulation must find the same messages as a full pass."""
+        path = get_path_for_data_file("elektromaten.complex16s")
+        full = analyze_signal(path)
+        chunked = analyze_signal(path, chunk_samples=300000)
+
+        self.assertEqual(chunked["num_messages"], full["num_messages"])
+        self.assertEqual(
+            [msg["bits"] for msg in chunked["messages"]],
+            [msg["bits"] for msg in full["messages"]],
+        )
+        # pauses cut at window borders are rebuilt from the absolute positions
+        self.assertEqual(
+            [msg["pause"] for msg in chunked["messages"]],
+            [msg["pause"] for msg in full["messages"]],
+        )
+
+    def test_analyze_signal_chunked_rejects_non_positive_size(self):
+        path = get_path_for_data_file("ask.complex")
+        for chunk_samples in (0, -300000):
+            with self.assertRaises(ValueError):
+                analyze_signal(path, chunk_samples=chunk_samples)
+
     def test_analyze_signal_elektromaten(self):
         result = analyze_signal(get_path_for_data_file("elektromaten.complex16s"))
 
@@ -68,6 +112,33 @@ class TestAgenticAnalysis(unittest.TestCase):
         # on the signal, but the key must exist and be a list
         self.assertIsInstance(result["protocol_fields"], list)
 
+    def test_protocol_fields_are_memoized(self):
+        """Analyzing the same capture twice reuses the inferred fields."""
+        path = get_path_for_data_file("homematic.complex32s")
+        first = analyze_signal(path)
+        hits = AgenticAnalysis._infer_protocol_fields.cache_info().hits
+        second = analyze_signal(path)
+
+        self.assertEqual(first["protocol_fields"], second["protocol_fields"])
+        self.assertEqual(
+            AgenticAnalysis._infer_protocol_fields.cache_info().hits, hits + 1
+        )
+
+    def test_loaded_signals_are_cached(self):
+        """Repeated analyses of an unchanged file reuse the loaded signal."""
+        path = get_path_for_data_file("ask.complex")
+        first = analyze_signal(path)
+        cached = [
+            entry
+            for key, entry in AgenticAnalysis._SIGNAL_CACHE.items()
+            if key[0].endswith("ask.complex")
+        ]
+        second = analyze_signal(path)
+
+        self.assertEqual(len(cached), 1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first["signal_parameters"], cached[0][1])
+
     def test_analyze_result_structure(self):
         """Every result dict must have the expected keys."""
         result = analyze_signal(get_path_for_data_file("fsk.complex"))
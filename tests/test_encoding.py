@@ -158,6 +158,29 @@ class TestDecoding(unittest.TestCase):
         print(calc_checksum3, "=?=", checksum3)
         self.assertTrue(calc_checksum3 == checksum3)
 
+    def test_wsp_checksum4(self):
+        # lengths that are not a multiple of 8 end with a partial byte
+        self.assertEqual(WSPChecksum.checksum4(util.hex2bit("5a3")), util.hex2bit("f"))
+        self.assertEqual(
+            WSPChecksum.checksum4(util.hex2bit("6b7c9")), util.hex2bit("5")
+        )
+        self.assertEqual(
+            WSPChecksum.checksum4(util.hex2bit("1f2e3d4c5")), util.hex2bit("3")
+        )
+        self.assertEqual(
+            WSPChecksum.checksum4(Encoding.str2bit("1011001110001")),
+            util.hex2bit("f"),
+        )
+
+    def test_wsp_checksum_switch_telegram(self):
+        wsp_checker = WSPChecksum()
+        # RORG 5 and 6 are switch telegrams and use checksum4 in auto mode
+        self.assertEqual(wsp_checker.calculate(util.hex2bit("5a30")), util.hex2bit("2"))
+        self.assertEqual(
+            wsp_checker.calculate(util.hex2bit("6b7c90")), util.hex2bit("e")
+        )
+        self.assertEqual(wsp_checker.calculate(util.hex2bit("5830")), util.hex2bit("0"))
+
     def test_morse(self):
         e = Encoding()
         e.morse_low = 3
@@ -1,7 +1,10 @@
+import os
+import tempfile
 import unittest
 
 import numpy as np
 
+from tests.utils_testing import get_path_for_data_file
 from urh.signalprocessing.IQArray import IQArray
 
 
@@ -195,3 +198,35 @@ class TestIQArray(unittest.TestCase):
             np.array_equal(iq32u, np.array([0, 32767, 32767, 65534], dtype=np.uint16)),
             msg=iq32u,
         )
+
+    def test_from_file_mmap(self):
+        filename = get_path_for_data_file("homematic.complex32s")
+        mapped = IQArray.from_file(filename, mmap=True)
+        loaded = IQArray.from_file(filename)
+
+        self.assertEqual(mapped, loaded)
+        self.assertEqual(mapped.dtype, np.int16)
+        self.assertTrue(mapped.data.flags.writeable)
+
+    def test_from_file_mmap_partial_item(self):
+        samples = np.arange(8, dtype=np.int16)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "truncated.complex32s")
+            with open(filename, "wb") as f:
+                # capture cut off in the middle of a 16 bit value
+                f.write(samples.tobytes() + b"\x01")
+
+            mapped = IQArray.from_file(filename, mmap=True)
+            loaded = IQArray.from_file(filename)
+            self.assertEqual(mapped, loaded)
+            self.assertEqual(mapped.num_samples, 4)
+
+    def test_from_any(self):
+        iq_array = IQArray(np.array([1, 2, 3, 4], dtype=np.int16))
+        self.assertIs(IQArray.from_any(iq_array), iq_array)
+
+        samples = np.array([1 + 2j, 3 + 4j], dtype=np.complex64)
+        wrapped = IQArray.from_any(samples)
+        self.assertEqual(wrapped.num_samples, 2)
+        self.assertEqual(wrapped.dtype, np.float32)
+        self.assertTrue(np.shares_memory(wrapped.data, samples))
@@ -1,11 +1,18 @@
 import base64
+import collections
+import functools
+import importlib
 import json
 import os
+import tempfile
 import unittest
+from unittest import mock
 
 import numpy as np
 
 from tests.utils_testing import get_path_for_data_file
+from urh import mcp_server
+from urh.ainterpretation.AgenticAnalysis import analyze_signal
 from urh.mcp_server import (
     analyze_iq_data,
     analyze_signal_file,
@@ -14,12 +21,30 @@ from urh.mcp_server import (
 )
 
 
+@functools.lru_cache(maxsize=8)
+def _load_f32(path):
+    """Read a float32 IQ file once per test run."""
+    return np.fromfile(path, dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=8)
+def _b64_f32(path):
+    """Base64 encoded contents of a float32 IQ file, encoded once per test run."""
+    return base64.b64encode(_load_f32(path).tobytes()).decode()
+
+
 class TestMCPServerTools(unittest.TestCase):
     """Tests for the URH MCP server tool functions."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls.FSK_PATH = get_path_for_data_file("fsk.complex")
+        cls.ASK_PATH = get_path_for_data_file("ask.complex")
+        cls.DATA_DIR = os.path.dirname(cls.FSK_PATH)
+
     def test_analyze_signal_file_fsk(self):
         """analyze_signal_file returns valid JSON with FSK detection."""
-        result_json = analyze_signal_file(get_path_for_data_file("fsk.complex"))
+        result_json = analyze_signal_file(self.FSK_PATH)
         result = json.loads(result_json)
 
         self.assertNotIn("error", result)
@@ -30,7 +55,7 @@ class TestMCPServerTools(unittest.TestCase):
 
     def test_analyze_signal_file_ask(self):
         """analyze_signal_file detects ASK modulation."""
-        result_json = analyze_signal_file(get_path_for_data_file("ask.complex"))
+        result_json = analyze_signal_file(self.ASK_PATH)
         result = json.loads(result_json)
 
         self.assertNotIn("error", result)
@@ -47,7 +72,7 @@ class TestMCPServerTools(unittest.TestCase):
 
     def test_analyze_signal_file_json_serializable(self):
         """All values in the result must be JSON-serializable (no numpy types)."""
-        result_json = analyze_signal_file(get_path_for_data_file("fsk.complex"))
+        result_json = analyze_signal_file(self.FSK_PATH)
         # json.loads would fail if any numpy types leaked through
         result = json.loads(result_json)
         # Re-serialize to confirm round-trip works
@@ -55,10 +80,7 @@ class TestMCPServerTools(unittest.TestCase):
 
     def test_analyze_iq_data_fsk(self):
         """analyze_iq_data decodes base64 float32 IQ data correctly."""
-        fsk_data = np.fromfile(
-            get_path_for_data_file("fsk.complex"), dtype=np.float32
-        )
-        b64 = base64.b64encode(fsk_data.tobytes()).decode()
+        b64 = _b64_f32(self.FSK_PATH)
         result_json = analyze_iq_data(b64, dtype="float32")
         result = json.loads(result_json)
 
@@ -66,6 +88,69 @@ class TestMCPServerTools(unittest.TestCase):
         self.assertEqual(result["signal_parameters"]["modulation_type"], "FSK")
         self.assertGreater(result["num_messages"], 0)
 
+    def test_analyze_iq_data_complex64(self):
+        """analyze_iq_data accepts complex64 samples without extra conversion."""
+        fsk_data = _load_f32(self.FSK_PATH)
+        b64 = base64.b64encode(fsk_data.view(np.complex64).tobytes()).decode()
+        result_json = analyze_iq_data(b64, dtype="complex64")
+        result = json.loads(result_json)
+
+        self.assertNotIn("error", result)
+        self.assertEqual(result["signal_parameters"]["modulation_type"], "FSK")
+        self.assertGreater(result["num_messages"], 0)
+
+    def test_analyze_iq_data_line_wrapped_base64(self):
+        """analyze_iq_data still accepts base64 with embedded newlines."""
+        fsk_data = _load_f32(self.FSK_PATH)
+        b64 = base64.encodebytes(fsk_data.tobytes()).decode()
+        result_json = analyze_iq_data(b64, dtype="float32")
+        result = json.loads(result_json)
+
+        self.assertNotIn("error", result)
+        self.assertEqual(result["signal_parameters"]["modulation_type"], "FSK")
+
+    @mock.patch.object(mcp_server, "_BASE64_CHUNK_CHARS", 8)
+    def test_decode_base64_chunked_padded(self):
+        """Padded input spanning several chunks is decoded into one buffer."""
+        raw = bytes(range(10))  # encodes to 16 characters ending in "=="
+        b64 = base64.b64encode(raw).decode()
+
+        with mock.patch.object(
+            mcp_server.base64, "b64decode", wraps=base64.b64decode
+        ) as b64decode:
+            decoded = mcp_server._decode_base64(b64)
+
+        self.assertEqual(decoded.tobytes(), raw)
+        self.assertTrue(decoded.flags.writeable)
+        # decoded chunkwise, without the lenient fallback
+        self.assertEqual(b64decode.call_count, 2)
+        for call in b64decode.call_args_list:
+            self.assertTrue(call.kwargs.get("validate"))
+
+    @mock.patch.object(mcp_server, "_BASE64_CHUNK_CHARS", 8)
+    def test_decode_base64_padding_on_chunk_boundary(self):
+        """Padding at the end of an inner chunk falls back to lenient decoding."""
+        b64 = base64.b64encode(b"ABCA").decode() + base64.b64encode(b"ABC").decode()
+        self.assertEqual(b64[6:8], "==")
+
+        with mock.patch.object(
+            mcp_server.base64, "b64decode", wraps=base64.b64decode
+        ) as b64decode:
+            decoded = mcp_server._decode_base64(b64)
+
+        self.assertEqual(decoded.tobytes(), base64.b64decode(b64))
+        self.assertTrue(decoded.flags.writeable)
+        self.assertFalse(b64decode.call_args_list[-1].kwargs.get("validate"))
+
+    @mock.patch.object(mcp_server, "_BASE64_CHUNK_CHARS", 8)
+    def test_analyze_iq_data_chunked_partial_sample(self):
+        """A decoded size that isn't a multiple of the dtype is reported."""
+        b64 = base64.b64encode(b"\x00" * 10).decode()
+        result = json.loads(analyze_iq_data(b64, dtype="float32"))
+
+        self.assertIn("error", result)
+        self.assertIn("parse", result["error"].lower())
+
     def test_analyze_iq_data_invalid_base64(self):
         """analyze_iq_data returns error for bad base64 input."""
         result_json = analyze_iq_data("not-valid-base64!!!")
@@ -93,16 +178,74 @@ class TestMCPServerTools(unittest.TestCase):
 
     def test_analyze_iq_data_with_known_params(self):
         """analyze_iq_data accepts pre-known noise and modulation."""
-        fsk_data = np.fromfile(
-            get_path_for_data_file("fsk.complex"), dtype=np.float32
-        )
-        b64 = base64.b64encode(fsk_data.tobytes()).decode()
+        b64 = _b64_f32(self.FSK_PATH)
         result_json = analyze_iq_data(b64, noise=0.01, modulation="FSK")
         result = json.loads(result_json)
 
         self.assertNotIn("error", result)
         self.assertEqual(result["signal_parameters"]["modulation_type"], "FSK")
 
+    def test_convert_numpy(self):
+        """_convert_numpy turns numpy scalars into native Python types."""
+        for value, expected, expected_type in (
+            (np.int64(-5), -5, int),
+            (np.uint8(255), 255, int),
+            (np.float32(0.5), 0.5, float),
+            (np.float16(1.5), 1.5, float),
+            (True, True, bool),
+            (None, None, type(None)),
+            # not in the dispatch table, handled by the isinstance fallback
+            (np.longdouble(2.5), 2.5, float),
+        ):
+            converted = mcp_server._convert_numpy(value)
+            self.assertEqual(converted, expected)
+            self.assertIs(type(converted), expected_type)
+
+    def test_convert_numpy_nested(self):
+        """Containers are converted recursively, dict subclasses included."""
+        value = {
+            "params": collections.OrderedDict(noise=np.float32(0.25)),
+            "messages": [{"bits": "0101", "pause": np.int64(100)}, [np.uint8(1)]],
+        }
+        converted = mcp_server._convert_numpy(value)
+
+        self.assertEqual(
+            converted,
+            {
+                "params": {"noise": 0.25},
+                "messages": [{"bits": "0101", "pause": 100}, [1]],
+            },
+        )
+        self.assertIs(type(converted["params"]["noise"]), float)
+        self.assertIs(type(converted["messages"][0]["pause"]), int)
+        self.assertIs(type(converted["messages"][1][0]), int)
+
+    def assert_json_close(self, first, second):
+        """Compare decoded JSON, allowing float32 rounding differences."""
+        if isinstance(first, float) or isinstance(second, float):
+            self.assertAlmostEqual(first, second, delta=1e-6 * max(1, abs(second)))
+        elif isinstance(first, dict):
+            self.assertEqual(first.keys(), second.keys())
+            for key in first:
+                self.assert_json_close(first[key], second[key])
+        elif isinstance(first, list):
+            self.assertEqual(len(first), len(second))
+            for a, b in zip(first, second):
+                self.assert_json_close(a, b)
+        else:
+            self.assertEqual(first, second)
+
+    @unittest.skipIf(mcp_server.orjson is None, "orjson is not installed")
+    def test_dumps_orjson_matches_json(self):
+        """The orjson and the json encoding decode to the same result."""
+        result = analyze_signal(self.FSK_PATH)
+
+        fast = json.loads(mcp_server._dumps(result))
+        with mock.patch.object(mcp_server, "orjson", None):
+            fallback = json.loads(mcp_server._dumps(result))
+
+        self.assert_json_close(fast, fallback)
+
     def test_list_supported_formats(self):
         """list_supported_formats returns a dict of extensions."""
         result_json = list_supported_formats()
@@ -113,10 +256,32 @@ class TestMCPServerTools(unittest.TestCase):
         self.assertIn(".blu", result)
         self.assertIn(".mat", result)
 
+    def test_json_output_is_compact(self):
+        """Tool output is compact JSON unless URH_MCP_PRETTY=1 is set."""
+        self.assertEqual(
+            list_supported_formats(),
+            json.dumps(mcp_server.SUPPORTED_FORMATS, separators=(",", ":")),
+        )
+        self.assertEqual(mcp_server._dumps({"bits": [0, 1]}), '{"bits":[0,1]}')
+
+    def test_json_output_pretty(self):
+        """URH_MCP_PRETTY=1 switches the tool output to indented JSON."""
+        self.addCleanup(importlib.reload, mcp_server)
+        with mock.patch.dict(os.environ, {"URH_MCP_PRETTY": "1"}):
+            importlib.reload(mcp_server)
+
+        self.assertEqual(
+            mcp_server.list_supported_formats(),
+            json.dumps(mcp_server.SUPPORTED_FORMATS, indent=2),
+        )
+        self.assertEqual(
+            mcp_server._dumps({"bits": [0, 1]}),
+            json.dumps({"bits": [0, 1]}, indent=2),
+        )
+
     def test_list_signal_files(self):
         """list_signal_files discovers signal files in the test data dir."""
-        data_dir = os.path.dirname(get_path_for_data_file("fsk.complex"))
-        result_json = list_signal_files(data_dir)
+        result_json = list_signal_files(self.DATA_DIR)
         result = json.loads(result_json)
 
         self.assertNotIn("error", result)
@@ -125,6 +290,17 @@ class TestMCPServerTools(unittest.TestCase):
         names = [f["name"] for f in result["files"]]
         self.assertIn("fsk.complex", names)
 
+    def test_list_signal_files_skips_bare_extensions(self):
+        """Hidden files named only like an extension are not signal files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in (".wav", ".blu", "capture.wav"):
+                open(os.path.join(tmpdir, name), "wb").close()
+
+            result = json.loads(list_signal_files(tmpdir))
+
+        self.assertEqual([f["name"] for f in result["files"]], ["capture.wav"])
+        self.assertEqual(result["files"][0]["format"], mcp_server.SUPPORTED_FORMATS[".wav"])
+
     def test_list_signal_files_bad_dir(self):
         """list_signal_files returns error for missing directory."""
         result_json = list_signal_files("/nonexistent/dir")
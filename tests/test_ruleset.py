@@ -0,0 +1,71 @@
+import unittest
+from unittest import mock
+
+from urh.signalprocessing.Message import Message
+from urh.signalprocessing.Ruleset import Rule, Ruleset, Mode
+
+
+class TestRuleset(unittest.TestCase):
+    def setUp(self):
+        # hex: aaf0
+        self.message = Message.from_plain_bits_str("1010101011110000")
+
+        self.bit_true = Rule(0, 3, "=", "1010", 0)
+        self.bit_false = Rule(8, 11, "=", "0000", 0)
+        self.hex_true = Rule(2, 3, "=", "f0", 1)
+        self.hex_false = Rule(0, 1, "!=", "aa", 1)
+
+    def test_all_apply(self):
+        ruleset = Ruleset(Mode.all_apply, [self.bit_true, self.hex_true])
+        self.assertTrue(ruleset.applies_for_message(self.message))
+
+        ruleset.append(self.bit_false)
+        self.assertFalse(ruleset.applies_for_message(self.message))
+
+    def test_atleast_one_applies(self):
+        ruleset = Ruleset(Mode.atleast_one_applies, [self.bit_false, self.hex_false])
+        self.assertFalse(ruleset.applies_for_message(self.message))
+
+        ruleset.append(self.hex_true)
+        self.assertTrue(ruleset.applies_for_message(self.message))
+
+    def test_none_applies(self):
+        ruleset = Ruleset(Mode.none_applies, [self.bit_false, self.hex_false])
+        self.assertTrue(ruleset.applies_for_message(self.message))
+
+        ruleset.append(self.bit_true)
+        self.assertFalse(ruleset.applies_for_message(self.message))
+
+    def test_empty_ruleset(self):
+        self.assertTrue(Ruleset(Mode.all_apply).applies_for_message(self.message))
+        self.assertFalse(
+            Ruleset(Mode.atleast_one_applies).applies_for_message(self.message)
+        )
+        self.assertTrue(Ruleset(Mode.none_applies).applies_for_message(self.message))
+
+    def test_mixed_value_types_decode_once_per_type(self):
+        rules = [
+            self.bit_true,
+            self.hex_true,
+            Rule(4, 7, "=", "1010", 0),
+            Rule(0, 1, "=", "aa", 1),
+        ]
+        ruleset = Ruleset(Mode.all_apply, rules)
+
+        with mock.patch.object(
+            Rule, "message_data", autospec=True, side_effect=Rule.message_data
+        ) as message_data:
+            self.assertTrue(ruleset.applies_for_message(self.message))
+
+        self.assertEqual(
+            sorted(call.args[0].value_type for call in message_data.call_args_list),
+            [0, 1],
+        )
+
+        for mode, expected in (
+            (Mode.all_apply, False),
+            (Mode.atleast_one_applies, True),
+            (Mode.none_applies, False),
+        ):
+            ruleset = Ruleset(mode, rules + [self.hex_false, self.bit_false])
+            self.assertEqual(ruleset.applies_for_message(self.message), expected)